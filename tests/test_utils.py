@@ -0,0 +1,54 @@
+from typing import Any
+
+import yaml
+from pydantic import BaseModel
+
+from vocal.utils import dataset_from_partial_yaml
+
+
+class _Dataset(BaseModel):
+    meta: dict[str, Any]
+    attributes: dict[str, Any]
+    dimensions: list[Any]
+    variables: list[Any]
+
+
+DEFINITION = {
+    "meta": {"file_pattern": "test.nc"},
+    "attributes": {"title": "test"},
+    "dimensions": [{"name": "time", "size": None}],
+    "variables": [{"meta": {"name": "time"}, "dimensions": ["time"], "attributes": {}}],
+}
+
+
+def _load(path, variable_template, globals_template, construct=False):
+    return dataset_from_partial_yaml(
+        str(path),
+        variable_template=variable_template,
+        globals_template=globals_template,
+        group_template={},
+        model=_Dataset,
+        construct=construct,
+    )
+
+
+def test_mutating_a_dataset_does_not_change_later_loads(tmp_path):
+    path = tmp_path / "definition.yaml"
+    path.write_text(yaml.safe_dump(DEFINITION))
+    variable_template = {"flag_values": [0, 1]}
+    globals_template = {"flags": ["a"]}
+
+    for construct in (False, True):
+        dataset = _load(path, variable_template, globals_template, construct=construct)
+        dataset.meta["file_pattern"] = "changed.nc"
+        dataset.dimensions[0]["size"] = 1
+        dataset.attributes["flags"].append("b")
+        dataset.variables[0]["attributes"]["flag_values"].append(2)
+
+        reloaded = _load(path, variable_template, globals_template, construct=construct)
+        assert reloaded.meta == {"file_pattern": "test.nc"}
+        assert reloaded.dimensions == [{"name": "time", "size": None}]
+        assert reloaded.attributes["flags"] == ["a"]
+        assert reloaded.variables[0]["attributes"]["flag_values"] == [0, 1]
+        assert variable_template == {"flag_values": [0, 1]}
+        assert globals_template == {"flags": ["a"]}
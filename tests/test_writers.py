@@ -0,0 +1,34 @@
+import contextlib
+import json
+import math
+
+from pydantic import BaseModel
+
+from vocal.writers import InstanceWriter
+
+
+class _Attributes(BaseModel):
+    fill_value: float
+    scale: float = 1.0
+
+
+class _InFolder:
+    def __init__(self, path):
+        self.path = path
+
+    def in_folder(self):
+        return contextlib.chdir(self.path)
+
+
+def test_instance_writer_round_trips_nan(tmp_path):
+    model = _Attributes(fill_value=math.nan, scale=1e-05)
+    InstanceWriter(
+        model=model, name="attrs", folder_manager=_InFolder(tmp_path)
+    ).write()
+
+    text = (tmp_path / "attrs.json").read_text(encoding="utf-8")
+    assert text == json.dumps({"fill_value": math.nan, "scale": 1e-05}, indent=2)
+
+    loaded = _Attributes(**json.loads(text))
+    assert math.isnan(loaded.fill_value)
+    assert loaded.scale == 1e-05
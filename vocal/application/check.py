@@ -7,7 +7,6 @@ import sys
 from netCDF4 import Dataset
 from pydantic import BaseModel
 from pydantic import ValidationError
-import yaml
 
 from vocal.utils.registry import Registry
 
@@ -22,6 +21,7 @@ from ..utils import (
     Printer,
     import_versioned_project,
     regexify_file_pattern,
+    load_spec,
 )
 from ..utils.conventions import (
     get_conventions_string,
@@ -59,11 +59,12 @@ def check_against_standard(
     nc = NetCDFReader(filename)
 
     try:
-        nc_noval = nc.to_model(model, validate=False)  # type: ignore
         nc.to_model(model)  # type: ignore
     except ValidationError as err:
         p.print_err(f"{TS.FAIL}{TS.BOLD}ERROR!{TS.ENDC}\n")
 
+        # The unvalidated model is only needed to locate errors
+        nc_noval = nc.to_model(model, validate=False)  # type: ignore
         error_locs = get_error_locs(err, nc_noval)
 
         for err_loc, err_msg in zip(*error_locs):
@@ -258,24 +259,25 @@ def load_matching_definitions(filename: str) -> list[str]:
     # Iterate over the definitions and filecodecs to find the matching
     # definition for the file.
     for path, codec in zip(paths, filecodecs):
-        def_files = [
-            f
-            for f in os.listdir(path)
-            if f.endswith(".json") and f != "dataset_schema.json"
-        ]
+        with os.scandir(path) as entries:
+            def_files = sorted(
+                entry.name
+                for entry in entries
+                if entry.name.endswith(".json")
+                and entry.name != "dataset_schema.json"
+            )
         for file in def_files:
-            with open(os.path.join(path, file), "r") as f:
-                data = yaml.load(f, Loader=yaml.Loader)
-
-                # Get the filename from the file pattern, and convert it to a
-                # regex.
-                rex = regexify_file_pattern(data["meta"]["file_pattern"], codec)
-
-                # If the filename matches the regex, we want to use this 
-                # definition.
-                if re.match(rex, os.path.basename(filename)):
-                    p.print_err(f"{TS.BOLD}{TS.OKGREEN}✔{TS.ENDC} Found matching definition: {file}")
-                    definitions.append(os.path.join(path, file))
+            file_pattern = load_spec(os.path.join(path, file))["meta"]["file_pattern"]
+
+            # Get the filename from the file pattern, and convert it to a
+            # regex.
+            rex = regexify_file_pattern(file_pattern, codec)
+
+            # If the filename matches the regex, we want to use this 
+            # definition.
+            if re.match(rex, os.path.basename(filename)):
+                p.print_err(f"{TS.BOLD}{TS.OKGREEN}✔{TS.ENDC} Found matching definition: {file}")
+                definitions.append(os.path.join(path, file))
 
     if len(definitions) == 0:
         p.print_err(
@@ -58,8 +58,7 @@ def load_registry() -> Registry:
     Returns:
         Registry: The registry of vocal projects.
     """
-    home = os.path.expanduser("~")
-    registry_file = os.path.join(home, ".vocal", "vocal-registry.yaml")
+    registry_file = get_default_registry_path()
 
     if not os.path.isfile(registry_file):
         return Registry(projects={})
@@ -4,10 +4,16 @@ from vocal.netcdf.mixins import (
     VariableNetCDFMixin,
     DimensionNetCDFMixin,
 )
-from vocal.utils.mixins import DatasetUtilsMixin, VocalValidatorsMixin
+from vocal.utils.mixins import (
+    ContainerUtilsMixin,
+    DatasetUtilsMixin,
+    VocalValidatorsMixin,
+)
 
 
-class VocalDatasetMixin(DatasetNetCDFMixin, DatasetUtilsMixin, VocalValidatorsMixin):
+class VocalDatasetMixin(
+    DatasetNetCDFMixin, DatasetUtilsMixin, ContainerUtilsMixin, VocalValidatorsMixin
+):
     pass
 
 
@@ -19,7 +25,7 @@ class VocalDimensionMixin(DimensionNetCDFMixin, VocalValidatorsMixin):
     pass
 
 
-class VocalGroupMixin(GroupNetCDFMixin, VocalValidatorsMixin):
+class VocalGroupMixin(GroupNetCDFMixin, ContainerUtilsMixin, VocalValidatorsMixin):
     pass
 
 
@@ -131,11 +131,13 @@ np_invert = {
 }
 
 
+_TYPE_SPEC_RE = re.compile(r"<(?:Array)?\[?([a-z0-9]+)\]?:?.*?>")
+
+
 def type_from_spec(spec: str) -> type:
 
-    rex = r"<(?:Array)?\[?([a-z0-9]+)\]?:?.*?>"
     try:
-        _str_type = re.search(rex, spec)
+        _str_type = _TYPE_SPEC_RE.search(spec)
         if _str_type is None:
             raise UnknownDataType(f"Unknown type: {spec}")
 
@@ -1,23 +1,37 @@
 from __future__ import annotations
 
-import copy
-import glob
+import functools
 import importlib
 import importlib.util
+import json
+import mmap
 import os
 import re
 import sys
 
-from typing import Iterator, Type, Generator
+from typing import Any, Iterator, Mapping, Type, Generator
 from types import ModuleType
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from contextlib import contextmanager
 
 from vocal.utils.conventions import Conventions
+from vocal.utils.loaders import YAML_LOADER
 
 import pydantic
 import yaml
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads  # type: ignore
+
+_PLACEHOLDER_RE = re.compile(
+    r"<(Array)?\[?([a-z0-9]+)\]?: derived_from_file\s?[^>]*>", re.ASCII
+)
+
+# Definition files larger than this are parsed from a memory map
+_MMAP_THRESHOLD = 64 * 1024
+
 
 def cache_dir() -> str:
     """
@@ -59,7 +73,7 @@ def _get_product_root(project: ModuleType) -> str:
     if project.__file__ is None:
         raise ValueError("The vocal project must be a module")
 
-    return os.path.sep.join(project.__file__.split(os.path.sep)[:-2])
+    return os.path.dirname(os.path.dirname(project.__file__))
 
 
 def regexify_file_pattern(file_pattern: str, filecodec: dict) -> str:
@@ -82,7 +96,26 @@ def get_product(
     project: ModuleType | None = None,
     version: str = "latest",
     product_root=None,
+    construct: bool = False,
 ) -> dict | None:
+    """
+    Get a versioned product from a vocal project.
+
+    Args:
+        short_name: the short name of the product
+        project: the vocal project
+        version: the version of the product
+        product_root: the root directory of the product. Defaults to the
+            parent of the project directory
+
+    Kwargs:
+        construct: if True, construct the product without validation. Only
+            use this for trusted specifications, such as those released by
+            the project itself.
+
+    Returns:
+        the product, as an instance of the project Dataset model
+    """
 
     if project is None:
         raise ValueError("The vocal project must be specified")
@@ -93,6 +126,12 @@ def get_product(
     spec = get_spec(
         short_name, project=project, version=version, product_root=product_root
     )
+
+    if construct:
+        if spec is None:
+            raise ValueError(f"Unable to find product {short_name}")
+        return project.models.Dataset.model_construct(**spec)
+
     return project.models.Dataset.model_validate(spec)
 
 
@@ -111,25 +150,72 @@ def get_spec(
 
     products_dir = _resolve_version(version, product_root)
 
-    defs = [
-        i
-        for i in glob.glob(os.path.join(products_dir, "*.json"))
-        if not i.endswith("dataset_schema.json")
-    ]
+    try:
+        with os.scandir(products_dir) as entries:
+            defs = [
+                i.path
+                for i in entries
+                if i.name.endswith(".json")
+                and not i.name.startswith(".")
+                and not i.name.endswith("dataset_schema.json")
+            ]
+    except FileNotFoundError:
+        return None
 
     for d in defs:
-        with open(d, "r") as y:
-            spec = yaml.load(y, Loader=yaml.Loader)
-            try:
-                if spec["meta"]["short_name"] == short_name:
-                    return spec
-            except Exception:
-                continue
+        spec = load_spec(d)
+        try:
+            if spec["meta"]["short_name"] == short_name:
+                return _clone(spec)
+        except Exception:
+            continue
 
     return None
 
 
-@dataclass
+def load_spec(specfile: str) -> dict:
+    """
+    Load a versioned product specification. Specifications are only parsed
+    again when the file has been modified, so the returned dict is shared
+    between callers, and should not be mutated.
+
+    Args:
+        specfile: the path to the json specification
+
+    Returns:
+        the parsed specification
+    """
+    return _load_spec(specfile, os.stat(specfile).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=256)
+def _load_spec(specfile: str, mtime: int) -> dict:
+    """
+    Load a versioned product specification. These are written as json, so
+    are parsed with orjson, if available, or the json module rather than
+    yaml, falling back to the json module for anything orjson rejects.
+    Results are cached on the file path and modification time. The
+    returned dict is shared, and should not be mutated.
+
+    Args:
+        specfile: the path to the json specification
+        mtime: the modification time of the file, in ns
+
+    Returns:
+        the parsed specification
+    """
+    with open(specfile, "rb") as f:
+        data = f.read()
+
+    try:
+        return _json_loads(data)
+    except ValueError:
+        # orjson rejects the NaN and Infinity tokens written by the json
+        # module, which older specifications may contain
+        return json.loads(data)
+
+
+@dataclass(slots=True)
 class FolderManager:
     """
     A class which manages folder creation and context switching.
@@ -159,9 +245,11 @@ class FolderManager:
         Returns:
             a list of the deleted contents of folder
         """
-        _files = os.listdir(folder)
-        for _file in _files:
-            os.remove(os.path.join(folder, _file))
+        _files = []
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                os.remove(entry.path)
+                _files.append(entry.name)
         return _files
 
     def _folder_name(self) -> str:
@@ -187,8 +275,6 @@ class FolderManager:
         try:
             os.chdir(folder)
             yield
-        except Exception:
-            raise
         finally:
             os.chdir(cwd)
 
@@ -203,8 +289,7 @@ def get_type_from_placeholder(placeholder: str) -> tuple[str, str]:
     Returns:
         An info type, for example <str>, <float32>
     """
-    rex = re.compile(r"<(Array)?\[?([a-z0-9]+)\]?: derived_from_file\s?.*>")
-    matches = rex.search(placeholder)
+    matches = _PLACEHOLDER_RE.search(placeholder)
     if not matches:
         raise ValueError("Unable to get type from placeholder")
 
@@ -214,6 +299,47 @@ def get_type_from_placeholder(placeholder: str) -> tuple[str, str]:
     return dtype, container
 
 
+def _clone(obj: Any) -> Any:
+    """
+    Return a copy of parsed yaml. This is a plain container of dicts, lists
+    and scalars, so this is much cheaper than copy.deepcopy.
+
+    Args:
+        obj: the object to copy
+
+    Returns:
+        a copy of obj
+    """
+    if isinstance(obj, dict):
+        return {k: _clone(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_clone(i) for i in obj]
+    return obj
+
+
+@functools.lru_cache(maxsize=64)
+def _load_definition_yaml(yamlfile: str, mtime: int) -> dict:
+    """
+    Load a product definition yaml file. Results are cached on the file path
+    and modification time, so a definition is only parsed once while it is
+    unchanged. The returned dict is shared, and should not be mutated.
+
+    Args:
+        yamlfile: the path to the yaml file
+        mtime: the modification time of the file, in ns
+
+    Returns:
+        the parsed yaml
+    """
+    with open(yamlfile, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            return yaml.load(f, Loader=YAML_LOADER)
+
+        # Let the parser read larger files straight from the page cache
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return yaml.load(mm, Loader=YAML_LOADER)
+
+
 def dataset_from_partial_yaml(
     yamlfile: str,
     variable_template: dict,
@@ -227,33 +353,37 @@ def dataset_from_partial_yaml(
         raise ValueError("Pydantic model has not been defined")
 
     def parse_definition(defn: dict, ctype: str = "dataset") -> dict:
+        # Build new containers only where templates are merged in, so the
+        # (cached) parsed yaml is never modified. Templates are only merged
+        # one level deep, so a shallow merge is sufficient.
+        parsed = dict(defn)
 
-        for var in defn["variables"]:
+        parsed["variables"] = [
+            {**var, "attributes": {**variable_template, **var["attributes"]}}
+            for var in defn["variables"]
+        ]
 
-            _temp = copy.deepcopy(variable_template)
-            _temp.update(var["attributes"])
-            var["attributes"] = _temp
-
-        try:
-            for g in defn["groups"]:
-                parse_definition(g, ctype="group")
-        except KeyError:
-            pass
+        if defn.get("groups"):
+            parsed["groups"] = [
+                parse_definition(g, ctype="group") for g in defn["groups"]
+            ]
 
         template = globals_template if ctype == "dataset" else group_template
-        _temp = copy.deepcopy(template)
-        _temp.update(defn["attributes"])
-        defn["attributes"] = _temp
+        parsed["attributes"] = {**template, **defn["attributes"]}
+
+        return parsed
 
-        return defn
+    y = _load_definition_yaml(yamlfile, os.stat(yamlfile).st_mtime_ns)
 
-    with open(yamlfile, "r") as f:
-        y = yaml.load(f, Loader=yaml.Loader)
+    # Models may hold on to (or validators may modify) the nested dicts and
+    # lists they are given, so give each model its own copy of the parsed
+    # yaml and merged template values
+    definition = _clone(parse_definition(y))
 
-        if construct:
-            return model.model_construct(**parse_definition(y))
+    if construct:
+        return model.model_construct(**definition)
 
-        return model(**parse_definition(y))
+    return model(**definition)
 
 
 def import_project(project: str) -> ModuleType:
@@ -269,14 +399,18 @@ def import_project(project: str) -> ModuleType:
 
     import_error_msg = f"Unable to import project {project}"
 
-    with flip_to_dir(os.path.dirname(project)):
-        module_path = os.path.join(os.path.basename(project), "__init__.py")
-        if not module_path.startswith("/"):
-            module_path = os.path.join(os.getcwd(), module_path)
+    project = os.path.realpath(project)
+    module_name = os.path.basename(project)
+    module_path = os.path.join(project, "__init__.py")
+
+    # Projects are registered in sys.modules by directory name, so only reuse
+    # an existing module if it was imported from the same file.
+    module = sys.modules.get(module_name)
+    if module is not None and getattr(module, "__file__", None) == module_path:
+        return module
 
-        spec = importlib.util.spec_from_file_location(
-            f"{os.path.basename(project)}", module_path
-        )
+    with flip_to_dir(os.path.dirname(project)):
+        spec = importlib.util.spec_from_file_location(module_name, module_path)
         if spec is None:
             raise ImportError(import_error_msg)
         try:
@@ -287,7 +421,12 @@ def import_project(project: str) -> ModuleType:
 
         module = importlib.util.module_from_spec(spec)
         sys.modules[spec.name] = module
-        spec.loader.exec_module(module)
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            # Don't leave a half-initialised module to be reused
+            sys.modules.pop(spec.name, None)
+            raise
 
     return module
 
@@ -327,38 +466,43 @@ def get_error_locs(
 
     return_data: tuple[list[str], list[str]] = ([], [])
 
-    for e in err.errors():
-        ncn = unvalidated.model_copy(deep=True)
+    # Only the location and message are used, so don't have pydantic build
+    # the url, context and input for each error.
+    errors = err.errors(include_url=False, include_context=False, include_input=False)
 
-        locs = []
+    for e in errors:
+        # The unvalidated model is only read, so it is walked directly
+        # rather than taking a (deep) copy per error.
+        ncn: Any = unvalidated
+
+        locs: list[str] = []
 
         for i in e["loc"]:
             current_name = None
 
-            try:
-                ncn = ncn[i]  # type: ignore
-            except Exception:
-                pass
-
-            try:
-                ncn = getattr(ncn, i)  # type: ignore
-            except Exception:
-                pass
+            if isinstance(ncn, Mapping):
+                if i in ncn:
+                    ncn = ncn[i]
+            elif isinstance(ncn, list):
+                if isinstance(i, int) and -len(ncn) <= i < len(ncn):
+                    ncn = ncn[i]
+            elif isinstance(i, str) and hasattr(ncn, i):
+                ncn = getattr(ncn, i)
 
-            try:
-                current_name = ncn["meta"]["name"]  # type: ignore
-            except (AttributeError, TypeError, KeyError):
-                pass
+            if isinstance(ncn, Mapping):
+                meta = ncn.get("meta")
+                if isinstance(meta, Mapping):
+                    current_name = meta.get("name")
 
             if i == "__root__":
                 current_name = "[root validator]"
 
             if current_name:
-                locs.append(current_name)
+                locs.append(str(current_name))
             else:
-                locs.append(i)
+                locs.append(str(i))
 
-        loc = "root -> " + " -> ".join([str(i) for i in locs])
+        loc = "root -> " + " -> ".join(locs)
         return_data[0].append(loc)
         return_data[1].append(e["msg"])
 
@@ -383,13 +527,24 @@ def flip_to_dir(path: str) -> Generator[str, None, None]:
     try:
         os.chdir(path)
         yield cwd
-    except Exception:
-        raise
     finally:
         os.chdir(cwd)
 
 
-@dataclass
+_TEXT_STYLES = (
+    "HEADER",
+    "OKBLUE",
+    "OKCYAN",
+    "OKGREEN",
+    "WARNING",
+    "FAIL",
+    "ENDC",
+    "BOLD",
+    "UNDERLINE",
+)
+
+
+@dataclass(slots=True)
 class TextStyles:
 
     _HEADER: str = "\033[95m"
@@ -404,11 +559,43 @@ class TextStyles:
 
     enabled: bool = True
 
-    def __getattr__(self, name: str) -> str:
-        if not self.enabled:
-            return ""
+    # Public styles, set from the escape codes above by _bind
+    HEADER: str = field(init=False, repr=False, compare=False)
+    OKBLUE: str = field(init=False, repr=False, compare=False)
+    OKCYAN: str = field(init=False, repr=False, compare=False)
+    OKGREEN: str = field(init=False, repr=False, compare=False)
+    WARNING: str = field(init=False, repr=False, compare=False)
+    FAIL: str = field(init=False, repr=False, compare=False)
+    ENDC: str = field(init=False, repr=False, compare=False)
+    BOLD: str = field(init=False, repr=False, compare=False)
+    UNDERLINE: str = field(init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name[1:] in _TEXT_STYLES or name == "enabled":
+            # enabled is the last field set in __init__, so wait for it
+            # before binding
+            if hasattr(self, "enabled"):
+                self._bind()
+
+    def _bind(self) -> None:
+        """
+        Set the public style attributes (BOLD, ENDC, etc.) from the escape
+        codes, or to empty strings if styles are disabled.
+        """
+        for style in _TEXT_STYLES:
+            object.__setattr__(
+                self, style, getattr(self, f"_{style}") if self.enabled else ""
+            )
+
+
+_PRINTER_FLAGS = frozenset(("quiet", "ignore_info", "ignore_warnings", "comments"))
+
 
-        return getattr(self, f"_{name.upper()}")
+def _noop(*args: Any, **kwargs: Any) -> None:
+    """
+    A print function which prints nothing.
+    """
 
 
 @dataclass
@@ -423,6 +610,35 @@ class Printer:
     ignore_warnings: bool = False
     comments: bool = False
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _PRINTER_FLAGS:
+            self._bind()
+
+    def _bind(self) -> None:
+        """
+        Bind the print methods for the current flags. Methods which are
+        suppressed are replaced with a no-op, and methods which are enabled
+        with the builtin print, so that neither pays for checking the flags
+        on every call.
+        """
+        bound = self.__dict__
+        show_info = not (self.quiet or self.ignore_info)
+
+        bound["print"] = print if show_info else _noop
+        bound["print_err"] = _noop if self.quiet else print
+        bound["print_comment"] = print if self.comments and not self.quiet else _noop
+        bound["print_warn"] = _noop if self.quiet or self.ignore_warnings else print
+
+        for name, enabled in (
+            ("print_line", show_info),
+            ("print_line_err", not self.quiet),
+        ):
+            if enabled:
+                bound.pop(name, None)
+            else:
+                bound[name] = _noop
+
     def print_line(self, len: int = 50, token: str = "-"):
         """
         Print a line of a given length, with a given token.
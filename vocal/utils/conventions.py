@@ -1,9 +1,12 @@
 from dataclasses import dataclass
+import functools
 import os
 import re
 import netCDF4
 import yaml
 
+from vocal.utils.loaders import YAML_LOADER
+
 
 @dataclass
 class Conventions:
@@ -25,6 +28,24 @@ class Conventions:
         return f"v{self.major_version}.{self.minor_version}"
 
 
+@functools.lru_cache(maxsize=1024)
+def _read_conventions_attr(ncfile: str, mtime: int) -> str | None:
+    """
+    Read the Conventions global attribute from a netCDF file. Results are
+    cached on the file path and modification time, so each file is only
+    opened once while it is unchanged.
+
+    Args:
+        ncfile: the path to the netCDF file
+        mtime: the modification time of the file, in ns
+
+    Returns:
+        the Conventions attribute, or None if it is not set
+    """
+    with netCDF4.Dataset(ncfile, "r") as nc:
+        return getattr(nc, "Conventions", None)
+
+
 def get_conventions_string(ncfile: str) -> str | None:
     """
     Get the conventions string from a netCDF file.
@@ -35,10 +56,7 @@ def get_conventions_string(ncfile: str) -> str | None:
     Returns:
         str: The conventions string.
     """
-    with netCDF4.Dataset(ncfile) as nc:
-        return getattr(nc, "Conventions", None)
-
-    return None
+    return _read_conventions_attr(ncfile, os.stat(ncfile).st_mtime_ns)
 
 
 def get_conventions_list(ncfile: str, delimiter: str = " ") -> list[str] | None:
@@ -58,8 +76,24 @@ def get_conventions_list(ncfile: str, delimiter: str = " ") -> list[str] | None:
     return conventions.split(delimiter)
 
 
+@functools.lru_cache(maxsize=None)
+def _compile_conventions_regex(conventions_regex: str) -> re.Pattern[str]:
+    """
+    Compile a conventions regular expression, caching the result.
+
+    Args:
+        conventions_regex: the regular expression to compile
+
+    Returns:
+        the compiled regular expression
+    """
+    return re.compile(conventions_regex)
+
+
 def extract_conventions_info(
-    ncfile: str, conventions_regex: str, name: str | None = None
+    ncfile: str,
+    conventions_regex: str | re.Pattern[str],
+    name: str | None = None,
 ) -> Conventions:
     """
     Extract conventions information from a netCDF file.
@@ -67,31 +101,36 @@ def extract_conventions_info(
     Args:
         ncfile: the path to the netCDF file
         conventions_regex: the regular expression to use to extract the
-            conventions information
+            conventions information, either as a string or precompiled
 
     Returns:
         the extracted conventions information
     """
-    with netCDF4.Dataset(ncfile, "r") as nc:
-        conventions = nc.getncattr("Conventions")
-        matches = re.search(conventions_regex, conventions)
-        if not matches:
-            raise ValueError("Unable to extract conventions information")
-
-        groups = matches.groupdict()
-        major = groups.get("major")
-        minor = groups.get("minor")
-
-        if major is not None:
-            major = int(major)
-        if minor is not None:
-            minor = int(minor)
-
-        return Conventions(
-            name=name or groups["name"],
-            major_version=major,
-            minor_version=minor,
-        )
+    if isinstance(conventions_regex, str):
+        conventions_regex = _compile_conventions_regex(conventions_regex)
+
+    conventions = get_conventions_string(ncfile)
+    if conventions is None:
+        raise ValueError("Unable to extract conventions information")
+
+    matches = conventions_regex.search(conventions)
+    if not matches:
+        raise ValueError("Unable to extract conventions information")
+
+    groups = matches.groupdict()
+    major = groups.get("major")
+    minor = groups.get("minor")
+
+    if major is not None:
+        major = int(major)
+    if minor is not None:
+        minor = int(minor)
+
+    return Conventions(
+        name=name or groups["name"],
+        major_version=major,
+        minor_version=minor,
+    )
 
 
 def read_conventions_identifier(path: str) -> str:
@@ -112,7 +151,7 @@ def read_conventions_identifier(path: str) -> str:
         )
 
     with open(conventions_id_file, "r") as f:
-        y = yaml.load(f, Loader=yaml.Loader)
+        y = yaml.load(f, Loader=YAML_LOADER)
 
     name = y["conventions"]["name"]
     regex = rf".*?(?P<name>{name})-(?P<major>[0-9]+)\.(?P<minor>[0-9]+),?\s?.*"
@@ -0,0 +1,47 @@
+"""
+Name indexes over the variables, groups and dimensions of a container. This
+module imports nothing from the rest of vocal, so it can be used by both the
+validators and the model mixins.
+"""
+
+from typing import Any
+
+
+def _build_index(items: Any, collection: str) -> dict[str, Any]:
+    if collection == "dimensions":
+        return {i.name: i for i in items}
+    return {i.meta.name: i for i in items}
+
+
+def index_by_name(container: Any, collection: str) -> dict[str, Any]:
+    """
+    Return the variables, groups or dimensions of a container, keyed by name.
+
+    Containers which provide a _name_indexes dict (see ContainerUtilsMixin)
+    have the index cached there. A cached index is rebuilt if the collection
+    has been replaced, e.g. by model_copy, or its length has changed, e.g. by
+    an append. Replacing or renaming an item in place is not detected.
+
+    Args:
+        container: the dataset or group model
+        collection: one of 'variables', 'groups' or 'dimensions'
+
+    Returns:
+        a dict mapping names to items
+    """
+    items = getattr(container, collection, None) or ()
+    cache = getattr(container, "_name_indexes", None)
+    if cache is None:
+        return _build_index(items, collection)
+
+    try:
+        cached_items, cached_len, index = cache[collection]
+    except KeyError:
+        pass
+    else:
+        if cached_items is items and cached_len == len(items):
+            return index
+
+    index = _build_index(items, collection)
+    cache[collection] = (items, len(items), index)
+    return index
@@ -0,0 +1,10 @@
+"""
+Fast yaml loader and dumper classes, shared by the vocal utilities. The
+libyaml backed classes are used where available, falling back to the pure
+python implementations otherwise.
+"""
+
+try:
+    from yaml import CSafeLoader as YAML_LOADER, CSafeDumper as YAML_DUMPER
+except ImportError:
+    from yaml import SafeLoader as YAML_LOADER, SafeDumper as YAML_DUMPER  # type: ignore
@@ -1,14 +1,20 @@
+import functools
 import inspect
 import os
 
+from typing import Any
+
 from vocal.utils import import_project
+from vocal.utils.indexing import index_by_name
 from vocal.validation import Validator
 
 
 class DatasetUtilsMixin:
 
-    def _get_vocal_project(self):
-        dataset_file = inspect.getfile(self.__class__)
+    @classmethod
+    @functools.cache
+    def _get_vocal_project(cls):
+        dataset_file = inspect.getfile(cls)
         project_dir = os.path.dirname(os.path.dirname(dataset_file))
         return import_project(project_dir)
 
@@ -40,18 +46,53 @@ class DatasetUtilsMixin:
             )
         )
 
+    @classmethod
+    @functools.cache
+    def _get_filecodec_regexes(cls) -> dict[str, str]:
+        return {i: j["regex"] for i, j in cls._get_vocal_project().filecodec.items()}
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _regex_from_pattern(cls, file_pattern: str) -> str:
+        return file_pattern.format(**cls._get_filecodec_regexes())
+
     @property
     def regex(self):
-        return self.meta.file_pattern.format(
-            **{i: j["regex"] for i, j in self._get_filecodec().items()}
-        )
+        return self._regex_from_pattern(self.meta.file_pattern)
+
+
+class ContainerUtilsMixin:
+    """
+    Provides the variables, groups and dimensions of a dataset or group
+    indexed by name. Each index is cached on the instance, and rebuilt when
+    the underlying list is replaced or changes length. Items replaced or
+    renamed in place are not picked up.
+    """
+
+    @functools.cached_property
+    def _name_indexes(self) -> dict[str, Any]:
+        return {}
+
+    @property
+    def variables_by_name(self) -> dict[str, Any]:
+        return index_by_name(self, "variables")
+
+    @property
+    def groups_by_name(self) -> dict[str, Any]:
+        return index_by_name(self, "groups")
+
+    @property
+    def dimensions_by_name(self) -> dict[str, Any]:
+        return index_by_name(self, "dimensions")
 
 
 class VocalValidatorsMixin:
 
+    @classmethod
+    @functools.cache
+    def _validator_names(cls) -> tuple[str, ...]:
+        return tuple(i for i in dir(cls) if i.startswith("_validate"))
+
     @property
     def validators(self) -> list[Validator]:
-        return [
-            getattr(self, i) for i in 
-            [j for j in dir(self) if j.startswith('_validate')]
-        ]
\ No newline at end of file
+        return [getattr(self, i) for i in self._validator_names()]
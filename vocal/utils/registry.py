@@ -1,3 +1,4 @@
+import functools
 import os
 import re
 import yaml
@@ -7,13 +8,54 @@ from dataclasses import dataclass
 from typing import Generator
 
 from vocal.utils import cache_dir
+from vocal.utils.loaders import YAML_DUMPER, YAML_LOADER
+
+_BACKREF_RE = re.compile(r"\\\d|\(\?P=")
+
+_DEFAULT_REGISTRY_PATH = os.path.join(cache_dir(), "vocal-registry.yaml")
 
 
 def get_default_registry_path() -> str:
     """
     Return the default path to the project registry file.
     """
-    return os.path.join(cache_dir(), "vocal-registry.yaml")
+    return _DEFAULT_REGISTRY_PATH
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_regex(regex: str) -> re.Pattern[str]:
+    """
+    Compile a project conventions regex, caching the result.
+    """
+    return re.compile(regex)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_union(regexes: tuple[str, ...]) -> re.Pattern[str] | None:
+    """
+    Compile a set of project conventions regexes into a single alternation,
+    which matches a conventions string if any of the regexes would. Returns
+    None if the regexes cannot be safely combined, e.g. if any use
+    backreferences or global inline flags.
+    """
+    if not regexes or any(_BACKREF_RE.search(r) for r in regexes):
+        return None
+
+    try:
+        return re.compile("|".join(f"(?:{r})" for r in regexes))
+    except re.error:
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _load_registry_yaml(path: str, mtime: int, size: int) -> dict:
+    """
+    Load a registry file. Results are cached on the file path, modification
+    time and size, so the registry is only parsed again once it has changed.
+    The returned dict is shared, and should not be mutated.
+    """
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=YAML_LOADER)
 
 
 @dataclass
@@ -84,19 +126,25 @@ class Registry:
         return cls(projects={k: Project.from_dict(v) for k, v in d.items()})
 
     @classmethod
-    def load(cls, path: str = get_default_registry_path()) -> "Registry":
-        with open(path, "r") as f:
-            try:
-                return cls.from_dict(yaml.load(f, Loader=yaml.Loader))
-            except AttributeError:
-                return cls(projects={})
+    def load(cls, path: str = _DEFAULT_REGISTRY_PATH) -> "Registry":
+        stat = os.stat(path)
+        try:
+            return cls.from_dict(
+                _load_registry_yaml(path, stat.st_mtime_ns, stat.st_size)
+            )
+        except AttributeError:
+            return cls(projects={})
 
     def to_dict(self) -> dict:
         return {k: v.to_dict() for k, v in self.projects.items()}
 
     def save(self, path: str) -> None:
-        with open(path, "w") as f:
-            yaml.dump(self.to_dict(), f)
+        # Write to a temporary file and move it into place, so the registry
+        # is never left partially written
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            yaml.dump(self.to_dict(), f, Dumper=YAML_DUMPER)
+        os.replace(tmp_path, path)
 
     def add_project(self, project: Project, force: bool = False) -> None:
         if project.spec.name in self.projects and not force:
@@ -109,25 +157,37 @@ class Registry:
     @classmethod
     @contextmanager
     def open(
-        cls, path: str = get_default_registry_path()
+        cls, path: str = _DEFAULT_REGISTRY_PATH
     ) -> Generator["Registry", None, None]:
         registry = cls.load(path)
+        original = registry.to_dict()
         yield registry
-        registry.save(path)
+
+        # Only write the registry back if it has been changed, by any means
+        if registry.to_dict() != original:
+            registry.save(path)
 
     @classmethod
     def filter(
-        cls, conventions_string: str, path: str = get_default_registry_path()
+        cls, conventions_string: str, path: str = _DEFAULT_REGISTRY_PATH
     ) -> "Registry":
-        projects = {}
+        projects: dict[str, Project] = {}
         registry = cls.load(path)
 
-        conventions = conventions_string.split(" ")
-        for project in registry:
-            spec = project.spec
-            for conv in conventions:
-                if re.match(spec.regex, conv):
-                    projects[project.spec.name] = project
-                    break
+        # Conventions which match no project are rejected with a single
+        # match against the union of all project regexes
+        union = _compile_union(tuple(p.spec.regex for p in registry))
+        conventions = [
+            conv
+            for conv in conventions_string.split(" ")
+            if union is None or union.match(conv)
+        ]
+        if not conventions:
+            return cls(projects=projects)
+
+        for name, project in registry.projects.items():
+            match = _compile_regex(project.spec.regex).match
+            if any(match(conv) for conv in conventions):
+                projects[name] = project
 
         return cls(projects=projects)
@@ -1,11 +1,12 @@
 from dataclasses import dataclass
 import enum
-import random
+import functools
+import itertools
 
-from string import ascii_lowercase, ascii_uppercase
 from typing import Any, Callable, Collection, Protocol, cast
 from pydantic import model_validator, field_validator
 
+from vocal.utils.indexing import index_by_name
 from vocal.vocab import Vocabulary
 
 @dataclass
@@ -84,20 +85,21 @@ def validate[I](binding: Binding, validator: Validator[I]) -> Validator[I]:
     return _bind_validator(binding)(validator)
 
 
+_object_names = itertools.count()
+
 
 def _randomize_object_name[I: Callable](obj: I) -> I:
     """
-    Randomize the name of an object (__name__), to work around a
+    Give an object a unique name (__name__), to work around a
     bug-or-odd-feature in pydantic
 
     Args:
         obj: the object to rename
 
     Returns:
-        obj with a random __name__
+        obj with a unique __name__
     """
-    _random_str = "".join(random.sample(ascii_lowercase + ascii_uppercase, 12))
-    obj.__name__ = _random_str
+    obj.__name__ = f"_vocal_v_{next(_object_names):x}"
     return obj
 
 
@@ -167,18 +169,10 @@ def variable_exists(variable_name: str) -> Validator:
         bound=Model.after
     )
     def _validator(cls, values):
-        try:
-            variables = values['variables']
-        except Exception:
-            variables = []
-            
-        name = getattr(values.meta, 'name', 'root')
-        if variables is None:
-            raise ValueError(f"Variable '{variable_name}' not found in {name}")
+        if variable_name in index_by_name(values, "variables"):
+            return values
 
-        for var in variables:
-            if var.meta.name == variable_name:
-                return values
+        name = getattr(values.meta, 'name', 'root')
         raise ValueError(f"Variable '{variable_name}' not found in {name}")
 
     return _randomize_object_name(_validator)
@@ -200,19 +194,16 @@ def variable_has_types(variable_name: str, allowed_types: list[str]) -> Callable
         description=f"Variable '{variable_name}' must be one of {allowed_types}"
     )
     def _validator(cls, values):
-        variables = values.variables
-        if variables is None:
+        var = index_by_name(values, "variables").get(variable_name)
+        if var is None:
             return values
-        for var in variables:
-            var_name = var.meta.name
-            var_type = var.meta.datatype
-            if var_name != variable_name:
-                continue
-            if var_type not in allowed_types:
-                raise ValueError(
-                    f'Expected datatype of variable "{variable_name}" to be '
-                    f'one of [{",".join(allowed_types)}], got {var_type}'
-                )
+
+        var_type = var.meta.datatype
+        if var_type not in allowed_types:
+            raise ValueError(
+                f'Expected datatype of variable "{variable_name}" to be '
+                f'one of [{",".join(allowed_types)}], got {var_type}'
+            )
         return values
 
     return _randomize_object_name(_validator)
@@ -230,29 +221,33 @@ def variable_has_dimensions(variable_name: str, dimensions: list[str]) -> Callab
         A validator function
     """
 
+    expected = frozenset(dimensions)
+
     @vocal_validator(
         description=f"Variable '{variable_name}' must have dimensions {dimensions}"
     )
     def _validator(cls, values):
-        variables = values.variables
-        if variables is None:
+        var = index_by_name(values, "variables").get(variable_name)
+        if var is None:
+            return values
+
+        var_dims = var.dimensions
+        actual = frozenset(var_dims)
+        if actual == expected:
             return values
-        for var in variables:
-            if var.meta.name != variable_name:
-                continue
-
-            var_dims = var.dimensions
-            for dim in dimensions:
-                if dim not in var_dims:
-                    raise ValueError(
-                        f'Expected variable "{variable_name}" to have dimension "{dim}"'
-                    )
-
-            for dim in var_dims:
-                if dim not in dimensions:
-                    raise ValueError(
-                        f'Variable "{variable_name}" has unexpected dimension ' f"{dim}"
-                    )
+
+        # Report the first offending dimension, in declaration order
+        for dim in dimensions:
+            if dim not in actual:
+                raise ValueError(
+                    f'Expected variable "{variable_name}" to have dimension "{dim}"'
+                )
+
+        for dim in var_dims:
+            if dim not in expected:
+                raise ValueError(
+                    f'Variable "{variable_name}" has unexpected dimension ' f"{dim}"
+                )
         return values
 
     return _randomize_object_name(_validator)
@@ -272,17 +267,10 @@ def group_exists(group_name: str) -> Callable:
 
     @vocal_validator(description=f"Group '{group_name}' must exist in supergroup")
     def _validator(cls, values):
-        try:
-            groups = values.groups
-        except Exception:
-            groups = []
-        name = values.meta.name
-        if groups is None:
-            raise ValueError(f"Group '{group_name}' not found in {name}")
+        if group_name in index_by_name(values, "groups"):
+            return values
 
-        for group in groups:
-            if group.meta.name == group_name:
-                return values
+        name = values.meta.name
         raise ValueError(f"Group '{group_name}' not found in {name}")
 
     return _randomize_object_name(_validator)
@@ -302,14 +290,10 @@ def dimension_exists(dimension_name: str) -> Callable:
 
     @vocal_validator(description=f"Dimension '{dimension_name}' must exist in group")
     def _validator(cls, values):
-        dimensions = values.dimensions
-        name = values.meta.name
-        if dimensions is None:
-            raise ValueError(f"Dimension '{dimension_name}' not found in {name}")
+        if dimension_name in index_by_name(values, "dimensions"):
+            return values
 
-        for dim in dimensions:
-            if dim.name == dimension_name:
-                return values
+        name = values.meta.name
         raise ValueError(f"Dimension '{dimension_name}' not found in {name}")
 
     return _randomize_object_name(_validator)
@@ -341,6 +325,37 @@ substitutor = model_validator(mode="before")
 validator = model_validator(mode="after")
 
 
+_DERIVED = "derived_from_file"
+_DERIVED_LEN = len(_DERIVED)
+
+
+def _is_placeholder(value: Any) -> bool:
+    """
+    Return True if a value is a string containing a derived_from_file
+    placeholder. Strings too short to hold the marker are rejected before
+    searching them.
+    """
+    return (
+        isinstance(value, str) and len(value) >= _DERIVED_LEN and _DERIVED in value
+    )
+
+
+@functools.cache
+def _property_examples(cls: Any) -> dict[str, Any]:
+    """
+    Return the examples given in the json schema of a model, by property
+    name. Generating the schema is expensive, so this is cached per model.
+
+    Args:
+        cls: The model class
+
+    Returns:
+        A dict mapping property names to their examples
+    """
+    properties = cls.model_json_schema().get("properties", {})
+    return {k: v["example"] for k, v in properties.items() if "example" in v}
+
+
 def substitute_placeholders(cls, values: dict) -> dict:
     """
     A root validator, which should be called with pre=True, which turns
@@ -355,7 +370,9 @@ def substitute_placeholders(cls, values: dict) -> dict:
     Returns:
         The cls with the placeholders substituted for example values
     """
-    DERIVED = "derived_from_file"
+    examples = _property_examples(cls)
+    if not examples:
+        return values
 
     for key, value in values.items():
 
@@ -363,22 +380,23 @@ def substitute_placeholders(cls, values: dict) -> dict:
             continue
 
         try:
-            example = cls.model_json_schema()["properties"][key]["example"]
+            example = examples[key]
         except KeyError:
             continue
 
-        if DERIVED in value:
-            values[key] = example
-
-        # Traverse any lists and replace values
-        if isinstance(value, list):
-            replaced = []
-            for i, list_val in enumerate(value):
-                if isinstance(list_val, str) and DERIVED in list_val:
-                    replaced.append(example[i])
-                else:
-                    replaced.append(list_val)
+        if isinstance(value, str):
+            if _DERIVED in value:
+                values[key] = example
+            continue
 
+        # Traverse any lists and replace values. The list may be shared with
+        # a definition template, so it is copied rather than changed in place,
+        # and only when there is something to replace.
+        hits = [i for i, list_val in enumerate(value) if _is_placeholder(list_val)]
+        if hits:
+            replaced = list(value)
+            for i in hits:
+                replaced[i] = example[i]
             values[key] = replaced
 
     return values
@@ -25,8 +25,22 @@ class ListVocabulary:
         self.name = name
         self.items = items
 
+    @property
+    def items(self) -> tuple[str, ...]:
+        """
+        The words in the vocabulary. These are held as a tuple, so they can
+        only be changed by assigning to items, which keeps the set used for
+        membership tests up to date.
+        """
+        return self._items
+
+    @items.setter
+    def items(self, items: list[str]) -> None:
+        self._items = tuple(items)
+        self._members = frozenset(self._items)
+
     def __contains__(self, word: str) -> bool:
-        return word in self.items
+        return word in self._members
 
     def __str__(self) -> str:
         return self.name
@@ -43,8 +57,9 @@ class CFStandardNames:
         """
         self.version = version
         self.allow_alias = allow_alias
-        self.tree: ET.ElementTree | None = None
-        self._load()
+        self._entries: set[str] = set()
+        self._aliases: set[str] = set()
+        self._loaded = False
 
     def __str__(self) -> str:
         """
@@ -68,17 +83,45 @@ class CFStandardNames:
         if filename is None:
             raise FileNotFoundError("No cached CF Standard Names vocabulary found.")
 
-        self.tree = ET.parse(filename)
+        entries: set[str] = set()
+        aliases: set[str] = set()
+
+        # Only the ids are needed, so stream the file and clear each element
+        # once it has been read, rather than holding the whole tree.
+        for _, elem in ET.iterparse(filename, events=("end",)):
+            if elem.tag == "entry":
+                entries.add(elem.get("id", ""))
+                elem.clear()
+            elif elem.tag == "alias":
+                aliases.add(elem.get("id", ""))
+                elem.clear()
+
+        entries.discard("")
+        aliases.discard("")
+        self._entries = entries
+        self._aliases = aliases
 
     def _load_from_remote(self) -> None:
         """
         Load the CF Standard Names vocabulary from the web.
         """
         url = f"https://cfconventions.org/Data/cf-standard-names/{self.version}/src/cf-standard-name-table.xml"
-        response = requests.get(url)
-        response.raise_for_status()
-        with open(self._cached_filename(), "wb") as f:
-            f.write(response.content)
+        filename = self._cached_filename()
+        tmp_filename = f"{filename}.tmp"
+
+        # Stream the table to a temporary file and move it into place once
+        # complete, so a failed download never leaves a truncated cache.
+        try:
+            with requests.get(url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                with open(tmp_filename, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=1 << 20):
+                        f.write(chunk)
+            os.replace(tmp_filename, filename)
+        finally:
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
+
         self._load_from_cache()
 
     def _load(self) -> None:
@@ -89,6 +132,7 @@ class CFStandardNames:
             self._load_from_cache()
         except FileNotFoundError:
             self._load_from_remote()
+        self._loaded = True
 
     def __contains__(self, word: str) -> bool:
         """
@@ -100,23 +144,12 @@ class CFStandardNames:
         Returns:
             bool: Whether the CF Standard Names vocabulary includes the word.
         """
-        if self.tree is None:
-            return False
-
-        root = self.tree.getroot()
-        for entry in root.findall("entry"):
-            if isinstance(entry, ET.Element):
-                std_name = entry.get("id")
-                if std_name == word:
-                    return True
-
-        if not self.allow_alias:
-            return False
+        # The vocabulary is loaded on first use, so that declaring it in a
+        # definition does not cost a parse, or a download.
+        if not self._loaded:
+            self._load()
 
-        for alias in root.findall("alias"):
-            if isinstance(alias, ET.Element):
-                std_name = alias.get("id")
-                if std_name == word:
-                    return True
+        if word in self._entries:
+            return True
 
-        return False
+        return self.allow_alias and word in self._aliases
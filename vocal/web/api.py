@@ -1,15 +1,27 @@
+import functools
 import os
 
+import anyio
+import anyio.to_thread
+import jinja2
+
 from fastapi import FastAPI, HTTPException, Request, File, UploadFile, status
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
+from vocal.utils import cache_dir
 from vocal.utils.registry import Registry
 from vocal.application.fetch import fetch_project
-from vocal.web.utils import check_upload
+from vocal.web.utils import check_upload, worker_lock
+
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as _DefaultResponse
+except ImportError:
+    _DefaultResponse = JSONResponse  # type: ignore
 
-app = FastAPI()
+app = FastAPI(default_response_class=_DefaultResponse)
 
 app.mount(
     "/static",
@@ -21,9 +33,50 @@ templates = Jinja2Templates(
 )
 
 
+def _bytecode_cache() -> jinja2.BytecodeCache | None:
+    """
+    Return a cache for compiled template bytecode in the vocal cache
+    directory, or None if that directory can't be created or written to.
+    """
+    path = os.path.join(cache_dir(), "jinja")
+    try:
+        os.makedirs(path, exist_ok=True)
+    except OSError:
+        return None
+
+    if not os.access(path, os.W_OK):
+        return None
+
+    return jinja2.FileSystemBytecodeCache(path)
+
+
+# Templates ship with the package, so keep their compiled bytecode between
+# processes where possible, and only check them for changes when debugging
+templates.env.bytecode_cache = _bytecode_cache()
+templates.env.auto_reload = os.environ.get("VOCAL_DEBUG", "false").lower() == "true"
+
+
+@functools.lru_cache(maxsize=None)
+def _render_static(name: str) -> str:
+    """
+    Render a template which takes no context. These pages cannot change
+    while the app is running, unless debugging, so are rendered only once.
+    """
+    return templates.get_template(name).render()
+
+
+def _static_page(name: str) -> HTMLResponse:
+    """
+    Return a response for a template which takes no context.
+    """
+    if templates.env.auto_reload:
+        return HTMLResponse(templates.get_template(name).render())
+    return HTMLResponse(_render_static(name))
+
+
 @app.get("/projects/add", response_class=HTMLResponse)
 async def add_project_get(request: Request) -> HTMLResponse:
-    return templates.TemplateResponse(request=request, name="add-project.html")
+    return _static_page("add-project.html")
 
 
 @app.post("/projects/add", response_class=RedirectResponse)
@@ -41,8 +94,14 @@ async def add_project_post(request: Request) -> RedirectResponse:
             detail="Invalid URL provided", status_code=status.HTTP_400_BAD_REQUEST
         )
 
+    # Fetching downloads the project and rewrites the registry, so run it
+    # off the event loop. It changes the working directory, so it shares
+    # worker_lock with checks.
     try:
-        fetch_project(url, git=False)
+        async with worker_lock:
+            await anyio.to_thread.run_sync(
+                functools.partial(fetch_project, url, git=False)
+            )
     except Exception as e:
         raise HTTPException(
             detail=f"Error fetching project: {e}",
@@ -54,8 +113,7 @@ async def add_project_post(request: Request) -> RedirectResponse:
 
 @app.get("/projects", response_class=HTMLResponse)
 async def projects(request: Request) -> HTMLResponse:
-    with Registry.open() as registry:
-        projects = registry.projects
+    projects = Registry.load().projects
 
     return templates.TemplateResponse(
         request=request, name="projects.html", context={"projects": projects}
@@ -66,22 +124,37 @@ async def projects(request: Request) -> HTMLResponse:
 async def root(request: Request):
 
     try:
-        with Registry.open() as registry:
-            num_projects = len(registry.projects)
+        num_projects = len(Registry.load())
     except FileNotFoundError:
         num_projects = 0
 
     if num_projects == 0:
-        return templates.TemplateResponse(request=request, name="no-projects.html")
+        return _static_page("no-projects.html")
 
-    return templates.TemplateResponse(request=request, name="checker.html")
+    return _static_page("checker.html")
 
 
-@app.post("/", response_class=JSONResponse)
+@app.post("/", response_class=HTMLResponse)
 async def upload(request: Request, file: UploadFile = File(...)) -> HTMLResponse:
 
     context = await check_upload(file)
 
+    # Pass the models themselves, rather than a dump, so only the parts the
+    # template renders are visited
     return templates.TemplateResponse(
-        request=request, name="checked.html", context=context.model_dump()
+        request=request,
+        name="checked.html",
+        context={
+            "projects": context.projects,
+            "definitions": context.definitions,
+            "errors": context.errors,
+        },
     )
+
+
+@app.post("/api/check")
+async def check(file: UploadFile = File(...)) -> JSONResponse:
+
+    context = await check_upload(file)
+
+    return _DefaultResponse(content=context.model_dump(mode="json"))
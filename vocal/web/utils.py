@@ -1,23 +1,34 @@
 import os
 import tempfile
 
+import anyio
+import anyio.to_thread
+
 from pydantic import ValidationError
 from fastapi import UploadFile, HTTPException, status
 
 from vocal.application.check import load_matching_definitions, load_matching_projects
-from vocal.checking import CheckError, ProductChecker
+from vocal.checking import CheckComment, CheckError, CheckWarning, ProductChecker
 from vocal.core import register_defaults_module
 from vocal.netcdf.writer import NetCDFReader
 from vocal.utils import get_error_locs, import_project
 from vocal.web.models import Check, CheckContext, CheckDefinition, CheckProject
 
+_UPLOAD_CHUNK_SIZE = 64 * 1024
 
-async def check_upload(file: UploadFile) -> CheckContext:
+# Taken around any worker thread which may change process-wide state: the
+# working directory (flip_to_dir), registered project defaults or netCDF-C.
+# Checks and project fetches both take it, so they never run together.
+worker_lock = anyio.Lock()
+
+
+def _check_file(file_path: str) -> CheckContext:
     """
-    Check the uploaded file against the registered projects and definitions.
+    Check a file against the registered projects and definitions which
+    match it.
 
     Args:
-        file (UploadFile): The file to check.
+        file_path (str): The path to the file to check.
 
     Returns:
         CheckContext: The context of the check.
@@ -25,98 +36,131 @@ async def check_upload(file: UploadFile) -> CheckContext:
 
     context = CheckContext()
 
-    # If no file is provided, raise an error
-    if not file.filename:
-        raise HTTPException(
-            detail="No file provided", status_code=status.HTTP_400_BAD_REQUEST
-        )
+    # Load the projects and definitions which match the file
+    # pattern and Conventions
+    projects = load_matching_projects(file_path)
+    definitions = load_matching_definitions(file_path)
 
-    with tempfile.TemporaryDirectory() as temp_dir:
+    # Read the file once, and check it against each project
+    if projects:
+        nc = NetCDFReader(file_path)
 
-        # Save the file to a temporary directory
-        file_path = os.path.join(temp_dir, file.filename)
-        with open(file_path, "wb") as f:
-            f.write(file.file.read())
-        file.file.close()
-
-        # Load the projects and definitions which match the file
-        # pattern and Conventions
-        projects = load_matching_projects(file_path)
-        definitions = load_matching_definitions(file_path)
-
-        # Check against each project
-        for project in projects:
-            project_name: str = ""
-
-            # Import the project module
-            try:
-                project_mod = import_project(project)
-                project_name = project_mod.__name__
-
-                context.projects[project_name] = CheckProject(
-                    passed=True,
-                    errors=[],
-                )
-            except Exception as e:
-                context.errors.append(f"Error loading project {project}: {e}")
-
-            # Register the project defaults
-            register_defaults_module(project_mod.defaults)
-
-            # Load the Dataset model from the project. If the model
-            # cannot be parsed, add the error to the context.
-            nc = NetCDFReader(file_path)
-            try:
-                nc_noval = nc.to_model(project_mod.models.Dataset, validate=False)
-                nc.to_model(project_mod.models.Dataset)
-
-            except ValidationError as err:
-                error_locs = get_error_locs(err, nc_noval)
-                context.projects[project_name].passed = False
-                for loc, msg in zip(*error_locs):
-                    context.projects[project_name].errors.append(
-                        CheckError(path=loc, message=msg)
-                    )
-
-        # Check against each definition
-        for definition in definitions:
-            context.definitions[os.path.basename(definition)] = CheckDefinition(
-                passed=True, warnings=False, comments=False, checks=[]
-            )
+    for project in projects:
+        project_name: str = ""
 
-            # Instantiate the ProductChecker and check the file against
-            # the definition
-            pc = ProductChecker(definition)
-            pc.check(file_path)
+        # Import the project module
+        try:
+            project_mod = import_project(project)
+            project_name = project_mod.__name__
 
-            # Parse the results of the check and add them to the context
-            context.definitions[os.path.basename(definition)].passed = all(
-                [r.passed for r in pc.checks]
+            context.projects[project_name] = CheckProject(
+                passed=True,
+                errors=[],
             )
+        except Exception as e:
+            context.errors.append(f"Error loading project {project}: {e}")
+
+        # Register the project defaults
+        register_defaults_module(project_mod.defaults)
+
+        # Load the Dataset model from the project. If the model
+        # cannot be parsed, add the error to the context.
+        try:
+            nc.to_model(project_mod.models.Dataset)
+
+        except ValidationError as err:
+            # The unvalidated model is only needed to locate errors
+            nc_noval = nc.to_model(project_mod.models.Dataset, validate=False)
+            error_locs = get_error_locs(err, nc_noval)
+            check_project = context.projects[project_name]
+            check_project.passed = False
+            check_project.errors.extend(
+                CheckError(path=loc, message=msg) for loc, msg in zip(*error_locs)
+            )
+
+    # Check against each definition
+    for definition in definitions:
+
+        # Instantiate the ProductChecker and check the file against
+        # the definition
+        pc = ProductChecker(definition)
+        pc.check(file_path)
+
+        # Parse the results of the check, and add them to the context as a
+        # single CheckDefinition
+        checks = pc.checks
+        has_comments = False
+        has_warnings = False
+        parsed_checks: list[Check] = []
+
+        for check in checks:
+            comment: CheckComment | None = None
+            warning: CheckWarning | None = None
+            error: CheckError | None = None
+
+            if check.passed:
+
+                if check.comment and check.has_comment:
+                    has_comments = True
+                    comment = check.comment
+
+                if check.warning and check.has_warning:
+                    has_warnings = True
+                    warning = check.warning
 
-            for check in pc.checks:
-                _check = Check(
+            else:
+                error = check.error
+
+            parsed_checks.append(
+                Check(
                     description=check.description,
+                    comment=comment,
+                    warning=warning,
+                    error=error,
                 )
+            )
 
-                if check.passed:
+        context.definitions[os.path.basename(definition)] = CheckDefinition(
+            passed=all(r.passed for r in checks),
+            warnings=has_warnings,
+            comments=has_comments,
+            checks=parsed_checks,
+        )
 
-                    if check.has_comment and check.comment:
-                        context.definitions[os.path.basename(definition)].comments = (
-                            True
-                        )
-                        _check.comment = check.comment
+    return context
 
-                    if check.has_warning and check.warning:
-                        context.definitions[os.path.basename(definition)].warnings = (
-                            True
-                        )
-                        _check.warning = check.warning
 
-                elif check.error:
-                    
-                    _check.error = check.error
+async def check_upload(file: UploadFile) -> CheckContext:
+    """
+    Check the uploaded file against the registered projects and definitions.
 
-                context.definitions[os.path.basename(definition)].checks.append(_check)
+    Args:
+        file (UploadFile): The file to check.
 
-    return context
+    Returns:
+        CheckContext: The context of the check.
+    """
+
+    # If no file is provided, raise an error
+    if not file.filename:
+        raise HTTPException(
+            detail="No file provided", status_code=status.HTTP_400_BAD_REQUEST
+        )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+
+        # Save the file to a temporary directory, in chunks, so the upload
+        # is never held in memory whole
+        file_path = os.path.join(temp_dir, file.filename)
+        try:
+            with open(file_path, "wb") as f:
+                while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+        finally:
+            await file.close()
+
+        # Run the check in a worker thread, so the event loop is free to
+        # serve other requests. Checks are run under worker_lock, as netCDF-C
+        # is not thread safe and project defaults are registered process-wide.
+        async with worker_lock:
+            return await anyio.to_thread.run_sync(_check_file, file_path)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import functools
 import os
 from typing import Any, ContextManager, Protocol, Container, Type, TYPE_CHECKING
 from pydantic import BaseModel
@@ -9,10 +10,22 @@ from dataclasses import dataclass
 
 from .utils import FolderManager
 
+_WRITE_BUFFER_SIZE = 64 * 1024
+
 if TYPE_CHECKING:
     from .core import ProductCollection
 
 
+@functools.lru_cache(maxsize=16)
+def _schema_json(model: Type[BaseModel], indent: int) -> str:
+    """
+    Return the json schema of a model class, as a string. Schema generation
+    walks the whole model, so the result is cached for each model and
+    indent.
+    """
+    return json.dumps(model.model_json_schema(), indent=indent)
+
+
 class SupportsInFolder(Protocol):
     def in_folder(self) -> ContextManager[None]: ...
 
@@ -40,11 +53,18 @@ class BaseWriter(ABC):
         """
         Write the model to file, as json, in a location given by folder_manager
         """
-        _filename = f"{self.name}.json"
         with self.folder_manager.in_folder():
-            mode = "w"
-            with open(f"{self.name}.json", mode) as f:
-                f.write(self._json)
+            self._write_in_folder()
+
+    def _write_in_folder(self) -> None:
+        """
+        Write the model to file, as json, in the current working directory.
+        Used when the caller has already entered folder_manager's folder.
+        """
+        with open(
+            f"{self.name}.json", "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE
+        ) as f:
+            f.write(self._json)
 
 
 class InstanceWriter(BaseWriter):
@@ -69,7 +89,8 @@ class SchemaWriter(BaseWriter):
 
     @property
     def _json(self) -> str:
-        return json.dumps(self.model.model_json_schema(), indent=self.indent)
+        model = self.model if isinstance(self.model, type) else type(self.model)
+        return _schema_json(model, self.indent)
 
 
 class ContainerWriter(BaseWriter):
@@ -97,11 +118,12 @@ class VocabularyCreator:
         """
         Write defined datasets to file.
         """
-        for name, dataset in self.product_collection.datasets:
-            writer = InstanceWriter(
-                model=dataset, name=name, folder_manager=folder_manager
-            )
-            writer.write()
+        with folder_manager.in_folder():
+            for name, dataset in self.product_collection.datasets:
+                writer = InstanceWriter(
+                    model=dataset, name=name, folder_manager=folder_manager
+                )
+                writer._write_in_folder()
 
     def write_schemata(self, folder_manager: SupportsInFolder) -> None:
         """
@@ -110,9 +132,12 @@ class VocabularyCreator:
         models = [self.product_collection.model]
         names = ["dataset_schema"]
 
-        for model, name in zip(models, names):
-            writer = SchemaWriter(model=model, name=name, folder_manager=folder_manager)
-            writer.write()
+        with folder_manager.in_folder():
+            for model, name in zip(models, names):
+                writer = SchemaWriter(
+                    model=model, name=name, folder_manager=folder_manager
+                )
+                writer._write_in_folder()
 
     def create_vocabulary(self) -> None:
         """